@@ -1,9 +1,20 @@
 """FlightRadar24 API client."""
 
 import logging
-from typing import List, Optional
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional speedup: orjson decodes large flight lists several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .models import Flight
 
@@ -21,7 +32,30 @@ class FR24Client:
 
     BASE_URL = "https://fr24api.flightradar24.com/api"
 
-    def __init__(self, api_key: str, timeout: int = 30, endpoint_type: str = "light"):
+    # Keep-alive connections held open to the API host
+    POOL_MAXSIZE = 8
+
+    # API limit on callsigns per full-endpoint request
+    MAX_CALLSIGNS_PER_REQUEST = 15
+
+    # Concurrent requests issued by get_flight_details_bulk
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # HTTP status codes worth retrying (rate limited / transient server errors)
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+    # Upper bound on a single retry delay in seconds
+    MAX_RETRY_DELAY = 30.0
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        endpoint_type: str = "light",
+        max_retries: int = 2,
+        base_delay: float = 1.0,
+        rate_limit_per_minute: int = 0,
+    ):
         """
         Initialize the FR24 API client.
 
@@ -29,10 +63,29 @@ class FR24Client:
             api_key: FlightRadar24 API key
             timeout: Request timeout in seconds
             endpoint_type: "light" or "full" - determines which endpoint to use
+            max_retries: Retries after the first attempt for transient failures
+            base_delay: Initial retry delay in seconds (doubles per retry)
+            rate_limit_per_minute: Client-side request budget (0 disables limiting)
         """
         self.api_key = api_key
         self.timeout = timeout
         self.endpoint_type = endpoint_type
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+
+        # Token bucket: allows a burst of one minute's budget, refilled continuously
+        self._bucket_cap = float(rate_limit_per_minute)
+        self._bucket_tokens = self._bucket_cap
+        self._refill_rate = rate_limit_per_minute / 60.0  # tokens per second
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        # Monotonic time before which the server has asked us not to call again
+        self._not_before = 0.0
+
+        # Set by close(); retry and rate-limit waits end as soon as it is set
+        self._closed = threading.Event()
+
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -42,6 +95,16 @@ class FR24Client:
             }
         )
 
+        # Reuse pooled keep-alive connections so each poll skips the TCP/TLS handshake
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+
+        # Item parser specialized for each endpoint's response shape
+        self._item_parsers = {
+            "light": self._parse_light_item,
+            "full": self._parse_full_item,
+        }
+
     def get_live_flights_light(
         self,
         bounds: tuple[float, float, float, float],
@@ -79,9 +142,39 @@ class FR24Client:
             return []
 
         # API limit is 15 callsigns per request
-        callsigns = callsigns[:15]
+        callsigns = callsigns[: self.MAX_CALLSIGNS_PER_REQUEST]
         return self._fetch_flights("full", callsigns=callsigns)
 
+    def get_flight_details_bulk(
+        self,
+        callsigns: List[str],
+    ) -> List[Flight]:
+        """
+        Fetch full details for any number of flights by callsign.
+
+        Splits the callsigns into API-sized chunks and requests them
+        concurrently over the pooled session, so N callsigns cost roughly
+        one round-trip rather than N/15.
+
+        Args:
+            callsigns: List of callsigns to fetch
+
+        Returns:
+            List of Flight objects with full details
+
+        Raises:
+            FR24APIError: If any of the requests fails
+        """
+        size = self.MAX_CALLSIGNS_PER_REQUEST
+        chunks = [callsigns[i : i + size] for i in range(0, len(callsigns), size)]
+        if len(chunks) <= 1:
+            return self.get_flight_details(callsigns)
+
+        workers = min(len(chunks), self.MAX_CONCURRENT_REQUESTS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(self.get_flight_details, chunks)
+            return [flight for chunk in results for flight in chunk]
+
     def get_live_flights(
         self,
         bounds: tuple[float, float, float, float],
@@ -134,13 +227,8 @@ class FR24Client:
             endpoint = f"{self.BASE_URL}/live/flight-positions/{endpoint_type}"
             logger.debug(f"Fetching from {endpoint} with params: {params}")
 
-            response = self.session.get(
-                endpoint,
-                params=params,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            return self._parse_response(response.json())
+            response = self._get_with_retry(endpoint, params)
+            return self._parse_response(json_loads(response.content), endpoint_type)
 
         except requests.exceptions.Timeout as e:
             logger.error(f"API request timed out: {e}")
@@ -152,9 +240,9 @@ class FR24Client:
 
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error: {e}")
-            if response.status_code == 401:
+            if e.response.status_code == 401:
                 raise FR24APIError("Invalid API key") from e
-            elif response.status_code == 429:
+            elif e.response.status_code == 429:
                 raise FR24APIError("Rate limit exceeded") from e
             raise FR24APIError(f"HTTP error: {e}") from e
 
@@ -162,49 +250,256 @@ class FR24Client:
             logger.error(f"Request failed: {e}")
             raise FR24APIError(f"Request failed: {e}") from e
 
-    def _parse_response(self, data: dict) -> List[Flight]:
+        except ValueError as e:
+            logger.error(f"Invalid JSON response: {e}")
+            raise FR24APIError(f"Invalid response: {e}") from e
+
+    def _get_with_retry(self, endpoint: str, params: dict) -> requests.Response:
+        """
+        Issue a GET request, retrying transient failures.
+
+        Timeouts, connection errors and 429/5xx responses are retried with
+        exponential backoff and jitter, honouring the Retry-After header when
+        the API sends one. Other HTTP errors (e.g. 401) are raised immediately.
+        When a Retry-After is not waited out here, requests fail fast until it
+        has passed.
+
+        Args:
+            endpoint: URL to request
+            params: Query parameters
+
+        Returns:
+            Successful response
+
+        Raises:
+            FR24APIError: If the client is closed, or the server's Retry-After
+                time has not passed yet
+            requests.exceptions.RequestException: If the request ultimately fails
+        """
+        if self._closed.is_set():
+            raise FR24APIError("Client closed")
+
+        wait = self._not_before - time.monotonic()
+        if wait > 0:
+            raise FR24APIError(f"Rate limit exceeded, next request allowed in {wait:.0f}s")
+
+        for attempt in range(self.max_retries + 1):
+            final_attempt = attempt == self.max_retries
+            self._acquire_token()
+            try:
+                response = self.session.get(
+                    endpoint,
+                    params=params,
+                    timeout=self.timeout,
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if final_attempt:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"Request failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response
+                retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and (
+                    final_attempt or retry_after > self.MAX_RETRY_DELAY
+                ):
+                    # Any request before the server's requested time would only
+                    # be rejected again (and spend another rate-limit token)
+                    self._not_before = max(self._not_before, time.monotonic() + retry_after)
+                    logger.warning(
+                        f"HTTP {response.status_code}, server asked to retry after "
+                        f"{retry_after:.0f}s, not retrying"
+                    )
+                    response.raise_for_status()
+                if final_attempt:
+                    response.raise_for_status()
+                delay = self._retry_delay(attempt, retry_after)
+                logger.warning(f"HTTP {response.status_code}, retrying in {delay:.1f}s")
+
+            self._wait(delay)
+
+    def _acquire_token(self) -> None:
+        """Block until the client-side rate limiter allows another request."""
+        if self._refill_rate <= 0:
+            return
+
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                self._bucket_cap,
+                self._bucket_tokens + (now - self._last_refill) * self._refill_rate,
+            )
+            self._last_refill = now
+
+            # Reserve this request's token now. A negative balance is a token
+            # still to accrue, so later callers queue behind this one
+            self._bucket_tokens -= 1
+            wait = -self._bucket_tokens / self._refill_rate
+
+        # Wait outside the lock so other threads can reserve meanwhile
+        if wait > 0:
+            logger.debug(f"Rate limit budget exhausted, waiting {wait:.1f}s")
+            self._wait(wait)
+
+    def _wait(self, seconds: float) -> None:
+        """
+        Wait before a request, ending early if the client is closed.
+
+        Args:
+            seconds: How long to wait
+
+        Raises:
+            FR24APIError: If the client is closed before or during the wait
+        """
+        if self._closed.wait(seconds):
+            raise FR24APIError("Client closed")
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calculate how long to wait before the next retry.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Seconds requested by the Retry-After header, if any
+
+        Returns:
+            Delay in seconds (the full Retry-After value when one was given)
+        """
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(self.MAX_RETRY_DELAY, self.base_delay * 2 ** attempt)
+        return delay * (1 + random.uniform(0, 0.5))
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given in seconds.
+
+        Args:
+            value: Header value, if any
+
+        Returns:
+            Seconds to wait, or None if absent or in the HTTP-date form
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None  # HTTP-date form, fall back to backoff
+
+    def _parse_response(self, data: dict, endpoint_type: str = "full") -> List[Flight]:
         """
         Parse API response into Flight objects.
 
         Args:
             data: Raw JSON response from API
+            endpoint_type: Endpoint the response came from ("light" or "full")
 
         Returns:
             List of Flight objects
         """
+        parse_item = self._item_parsers.get(endpoint_type, self._parse_full_item)
+        items = data.get("data", [])
+
+        # Fast path: malformed items are rare, so parse everything in one go
+        # and only fall back to item-by-item handling if something fails
+        try:
+            flights = [parse_item(item) for item in items]
+        except (KeyError, ValueError, TypeError):
+            flights = self._parse_items_individually(items, parse_item)
+
+        logger.debug(f"Parsed {len(flights)} flights from API response")
+        return flights
+
+    def _parse_items_individually(
+        self,
+        items: List[dict],
+        parse_item: Callable[[dict], Flight],
+    ) -> List[Flight]:
+        """
+        Parse response items one at a time, skipping any that are malformed.
+
+        Args:
+            items: Raw flight items from the API response
+            parse_item: Endpoint-specific item parser
+
+        Returns:
+            List of Flight objects for the items that parsed successfully
+        """
         flights = []
-        flight_data = data.get("data", [])
 
-        for item in flight_data:
+        for item in items:
             try:
-                # Light endpoint fields:
-                # fr24_id, hex, callsign, lat, lon, track, alt, gspeed, vspeed, squawk, timestamp, source
-                #
-                # Full endpoint has additional fields like origin, destination, aircraft, etc.
-
-                flight = Flight(
-                    flight_id=str(item.get("fr24_id", "") or item.get("flightId", "") or item.get("id", "")),
-                    callsign=item.get("callsign", "") or "",
-                    airline=self._extract_airline(item),
-                    aircraft_type=self._extract_aircraft_type(item),
-                    origin=self._extract_airport(item, "origin"),
-                    destination=self._extract_airport(item, "destination"),
-                    latitude=float(item.get("lat", 0) or item.get("latitude", 0) or 0),
-                    longitude=float(item.get("lon", 0) or item.get("longitude", 0) or 0),
-                    altitude=int(item.get("alt", 0) or item.get("altitude", 0) or 0),
-                    ground_speed=int(item.get("gspeed", 0) or item.get("groundSpeed", 0) or item.get("speed", 0) or 0),
-                    heading=int(item.get("track", 0) or item.get("heading", 0) or 0),
-                    registration=item.get("registration", "") or item.get("hex", "") or "",
-                    vertical_speed=int(item.get("vspeed", 0) or 0) if item.get("vspeed") is not None else None,
-                )
-                flights.append(flight)
+                flights.append(parse_item(item))
             except (KeyError, ValueError, TypeError) as e:
                 logger.warning(f"Failed to parse flight data: {e} - item: {item}")
                 continue
 
-        logger.debug(f"Parsed {len(flights)} flights from API response")
         return flights
 
+    def _parse_light_item(self, item: dict) -> Flight:
+        """
+        Parse a single item from the light endpoint.
+
+        Only reads the fields the light endpoint returns:
+        fr24_id, hex, callsign, lat, lon, track, alt, gspeed, vspeed, squawk, timestamp, source
+
+        Args:
+            item: Flight data dictionary
+
+        Returns:
+            Flight object (airline is derived from the callsign by Flight)
+        """
+        vspeed = item.get("vspeed")
+        return Flight(
+            flight_id=str(item.get("fr24_id") or ""),
+            callsign=item.get("callsign") or "",
+            airline="",
+            aircraft_type="",
+            origin="",
+            destination="",
+            latitude=float(item.get("lat") or 0),
+            longitude=float(item.get("lon") or 0),
+            altitude=int(item.get("alt") or 0),
+            ground_speed=int(item.get("gspeed") or 0),
+            heading=int(item.get("track") or 0),
+            registration=item.get("hex") or "",
+            vertical_speed=int(vspeed) if vspeed is not None else None,
+        )
+
+    def _parse_full_item(self, item: dict) -> Flight:
+        """
+        Parse a single item from the full endpoint.
+
+        The full endpoint adds route, aircraft and airline details, whose shape
+        varies, so this tolerates the alternative field names.
+
+        Args:
+            item: Flight data dictionary
+
+        Returns:
+            Flight object
+        """
+        return Flight(
+            flight_id=str(item.get("fr24_id", "") or item.get("flightId", "") or item.get("id", "")),
+            callsign=item.get("callsign", "") or "",
+            airline=self._extract_airline(item),
+            aircraft_type=self._extract_aircraft_type(item),
+            origin=self._extract_airport(item, "origin"),
+            destination=self._extract_airport(item, "destination"),
+            latitude=float(item.get("lat", 0) or item.get("latitude", 0) or 0),
+            longitude=float(item.get("lon", 0) or item.get("longitude", 0) or 0),
+            altitude=int(item.get("alt", 0) or item.get("altitude", 0) or 0),
+            ground_speed=int(item.get("gspeed", 0) or item.get("groundSpeed", 0) or item.get("speed", 0) or 0),
+            heading=int(item.get("track", 0) or item.get("heading", 0) or 0),
+            registration=item.get("registration", "") or item.get("hex", "") or "",
+            vertical_speed=int(item.get("vspeed", 0) or 0) if item.get("vspeed") is not None else None,
+        )
+
     def _extract_aircraft_type(self, item: dict) -> str:
         """Extract aircraft type from response."""
         # Full endpoint format
@@ -256,7 +551,8 @@ class FR24Client:
         return ""
 
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session, interrupting any retry or rate-limit wait."""
+        self._closed.set()
         self.session.close()
 
     def __enter__(self):
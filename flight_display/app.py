@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import List
 
 from .api_client import FR24Client
@@ -12,6 +13,14 @@ from .updater import DataUpdater
 
 logger = logging.getLogger(__name__)
 
+# Sort key for each supported display.sort_by value
+SORT_KEYS = {
+    "distance": attrgetter("distance_km"),
+    "altitude": attrgetter("altitude"),
+    "callsign": attrgetter("callsign"),
+    "speed": attrgetter("ground_speed"),
+}
+
 
 class FlightDisplayApp:
     """Main application that orchestrates all components."""
@@ -43,6 +52,7 @@ class FlightDisplayApp:
                 api_key=config.api.key,
                 timeout=config.api.timeout,
                 endpoint_type=config.api.endpoint_type,
+                rate_limit_per_minute=config.api.rate_limit_per_minute,
             )
             logger.info(f"Using FR24 API endpoint: {config.api.endpoint_type}")
 
@@ -104,7 +114,8 @@ class FlightDisplayApp:
         flights = self._sort_flights(flights)
 
         # Limit display count
-        flights = flights[: self.config.display.max_flights]
+        if len(flights) > self.config.display.max_flights:
+            flights = flights[: self.config.display.max_flights]
 
         # Update UI
         self.window.update_flights(flights)
@@ -144,23 +155,21 @@ class FlightDisplayApp:
         Returns:
             Sorted list of flights
         """
-        sort_key = self.config.display.sort_by
-        reverse = not self.config.display.sort_ascending
-
-        if sort_key == "distance":
-            return sorted(flights, key=lambda f: f.distance_km, reverse=reverse)
-        elif sort_key == "altitude":
-            return sorted(flights, key=lambda f: f.altitude, reverse=reverse)
-        elif sort_key == "callsign":
-            return sorted(flights, key=lambda f: f.callsign, reverse=reverse)
-        elif sort_key == "speed":
-            return sorted(flights, key=lambda f: f.ground_speed, reverse=reverse)
-        else:
+        sort_key = SORT_KEYS.get(self.config.display.sort_by)
+        if sort_key is None:
             return flights
 
+        return sorted(
+            flights,
+            key=sort_key,
+            reverse=not self.config.display.sort_ascending,
+        )
+
     def _cleanup(self):
         """Clean up resources on shutdown."""
         logger.info("Shutting down...")
-        self.updater.stop()
+        # Close the client first: that ends any retry or rate-limit wait in
+        # the worker, so stop() does not sit out the rest of it
         self.api_client.close()
+        self.updater.stop()
         logger.info("Cleanup complete")
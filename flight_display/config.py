@@ -5,7 +5,16 @@ import math
 import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+try:
+    # libyaml C bindings parse several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed config files keyed by path, reused while the file's mtime is unchanged
+_yaml_cache: Dict[str, Tuple[float, dict]] = {}
 
 
 @dataclass
@@ -15,15 +24,27 @@ class APIConfig:
     key: str
     timeout: int = 30
     endpoint_type: str = "light"  # "light" or "full"
+    rate_limit_per_minute: int = 0  # 0 = no client-side limit
 
 
-@dataclass
+@dataclass(frozen=True)
 class LocationConfig:
     """Location configuration for center point and bounding box."""
 
     center_lat: float
     center_lon: float
     bounding_box_km: float = 100.0
+    # Derived from the center point once, for distance calculations
+    center_lat_rad: float = field(init=False, repr=False, compare=False)
+    center_lon_rad: float = field(init=False, repr=False, compare=False)
+    center_cos_lat: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the center point in radians (frozen, so set directly)."""
+        lat_rad = math.radians(self.center_lat)
+        object.__setattr__(self, "center_lat_rad", lat_rad)
+        object.__setattr__(self, "center_lon_rad", math.radians(self.center_lon))
+        object.__setattr__(self, "center_cos_lat", math.cos(lat_rad))
 
 
 @dataclass
@@ -53,6 +74,10 @@ class Config:
     display: DisplayConfig = field(default_factory=DisplayConfig)
     ui: UIConfig = field(default_factory=UIConfig)
 
+    def __post_init__(self):
+        """Precompute values derived from the (immutable) location."""
+        self._bounds = self._calculate_bounds()
+
     @classmethod
     def load(cls, path: Optional[str] = None) -> "Config":
         """
@@ -85,8 +110,7 @@ class Config:
                 "Create config.yaml or specify path with --config"
             )
 
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
 
         # Check for API key in environment variable first
         api_key = os.environ.get("FR24_API_KEY", data.get("api", {}).get("key"))
@@ -100,6 +124,7 @@ class Config:
                 key=api_key,
                 timeout=data.get("api", {}).get("timeout", 30),
                 endpoint_type=data.get("api", {}).get("endpoint_type", "light"),
+                rate_limit_per_minute=data.get("api", {}).get("rate_limit_per_minute", 0),
             ),
             location=LocationConfig(
                 center_lat=data["location"]["center_lat"],
@@ -119,6 +144,15 @@ class Config:
         )
 
     def get_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Get the bounding box around the center point.
+
+        Returns:
+            Tuple of (north, south, west, east) coordinates.
+        """
+        return self._bounds
+
+    def _calculate_bounds(self) -> Tuple[float, float, float, float]:
         """
         Calculate bounding box from center point and radius.
 
@@ -128,9 +162,7 @@ class Config:
         # Approximate: 1 degree latitude = 111 km
         # Longitude varies with latitude, use cosine correction
         km_per_degree_lat = 111.0
-        km_per_degree_lon = 111.0 * math.cos(
-            math.radians(self.location.center_lat)
-        )
+        km_per_degree_lon = 111.0 * self.location.center_cos_lat
 
         lat_delta = self.location.bounding_box_km / km_per_degree_lat
         lon_delta = self.location.bounding_box_km / km_per_degree_lon
@@ -141,3 +173,25 @@ class Config:
         east = self.location.center_lon + lon_delta
 
         return (north, south, west, east)
+
+
+def _load_yaml(path: str) -> dict:
+    """
+    Parse a YAML file, reusing the previous result if it has not changed.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+    """
+    mtime = os.path.getmtime(path)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    _yaml_cache[path] = (mtime, data)
+    return data
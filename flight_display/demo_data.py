@@ -5,9 +5,10 @@ import math
 from typing import List
 
 from .models import Flight
+from .utils import haversine_from_center
 
 # Sample airlines with ICAO codes
-AIRLINES = [
+AIRLINES = (
     ("BAW", "British Airways"),
     ("RYR", "Ryanair"),
     ("EZY", "easyJet"),
@@ -23,10 +24,10 @@ AIRLINES = [
     ("AAL", "American Airlines"),
     ("UAL", "United Airlines"),
     ("DAL", "Delta"),
-]
+)
 
 # Sample aircraft types
-AIRCRAFT_TYPES = [
+AIRCRAFT_TYPES = (
     "A320",
     "A321",
     "A319",
@@ -42,10 +43,10 @@ AIRCRAFT_TYPES = [
     "CRJ9",
     "AT76",
     "DH8D",
-]
+)
 
 # Sample airports (IATA codes)
-AIRPORTS = [
+AIRPORTS = (
     "LHR",
     "LGW",
     "STN",
@@ -76,7 +77,11 @@ AIRPORTS = [
     "ARN",
     "HEL",
     "DUB",
-]
+)
+
+# Distance moved per update for each knot of ground speed
+# (knots -> km/h, assuming ~10 second intervals)
+KM_PER_KNOT_PER_UPDATE = 1.852 / 360
 
 
 class DemoDataGenerator:
@@ -102,6 +107,11 @@ class DemoDataGenerator:
         self.center_lon = center_lon
         self.radius_km = radius_km
         self.num_flights = num_flights
+        # Center point in radians and longitude scale at the center latitude
+        # (fixed for the generator's lifetime)
+        self._center_lat_rad = math.radians(center_lat)
+        self._center_lon_rad = math.radians(center_lon)
+        self._cos_center = math.cos(self._center_lat_rad)
         self._flights: List[Flight] = []
         self._initialize_flights()
 
@@ -121,7 +131,7 @@ class DemoDataGenerator:
 
         # Convert to lat/lon offset (approximate)
         lat_offset = (distance / 111.0) * math.cos(angle)
-        lon_offset = (distance / (111.0 * math.cos(math.radians(self.center_lat)))) * math.sin(angle)
+        lon_offset = (distance / (111.0 * self._cos_center)) * math.sin(angle)
 
         lat = self.center_lat + lat_offset
         lon = self.center_lon + lon_offset
@@ -131,9 +141,14 @@ class DemoDataGenerator:
         flight_num = random.randint(100, 9999)
         callsign = f"{airline_code}{flight_num}"
 
-        # Random airports (ensure they're different)
-        origin = random.choice(AIRPORTS)
-        destination = random.choice([a for a in AIRPORTS if a != origin])
+        # Random airports (ensure they're different): pick the destination from
+        # the remaining airports by skipping over the origin's index
+        origin_index = random.randrange(len(AIRPORTS))
+        destination_index = random.randrange(len(AIRPORTS) - 1)
+        if destination_index >= origin_index:
+            destination_index += 1
+        origin = AIRPORTS[origin_index]
+        destination = AIRPORTS[destination_index]
 
         # Random but realistic values
         altitude = random.choice([
@@ -173,10 +188,22 @@ class DemoDataGenerator:
         Get current list of flights with updated positions.
 
         Each call slightly updates flight positions to simulate movement.
+        Moved flights are new Flight objects in a new list, so lists returned
+        by earlier calls are never changed and can be handed to another thread.
 
         Returns:
-            List of Flight objects
+            A new list of Flight objects on every call
         """
+        # Hoist per-call invariants out of the per-flight loop
+        radians = math.radians
+        cos = math.cos
+        sin = math.sin
+        randint = random.randint
+        center_lat_rad = self._center_lat_rad
+        center_lon_rad = self._center_lon_rad
+        cos_center = self._cos_center
+        respawn_distance = self.radius_km * 1.5
+
         # Update each flight's position slightly
         updated_flights = []
 
@@ -184,22 +211,22 @@ class DemoDataGenerator:
             # Move flight in its heading direction
             if flight.ground_speed > 0:
                 # Calculate movement (simplified)
-                speed_kmh = flight.ground_speed * 1.852  # knots to km/h
-                # Movement per update (assuming ~10 second intervals)
-                movement_km = speed_kmh / 360  # km per 10 seconds
+                movement_km = flight.ground_speed * KM_PER_KNOT_PER_UPDATE
 
-                heading_rad = math.radians(flight.heading)
-                lat_change = (movement_km / 111.0) * math.cos(heading_rad)
-                lon_change = (movement_km / (111.0 * math.cos(math.radians(flight.latitude)))) * math.sin(heading_rad)
+                heading_rad = radians(flight.heading)
+                lat_change = (movement_km / 111.0) * cos(heading_rad)
+                lon_change = (movement_km / (111.0 * cos(radians(flight.latitude)))) * sin(heading_rad)
 
                 new_lat = flight.latitude + lat_change
                 new_lon = flight.longitude + lon_change
 
-                # Recalculate distance
-                new_distance = self._calculate_distance(new_lat, new_lon)
+                # Recalculate distance from the precomputed center
+                new_distance = haversine_from_center(
+                    center_lat_rad, center_lon_rad, cos_center, new_lat, new_lon
+                )
 
                 # If flight has moved too far, respawn it
-                if new_distance > self.radius_km * 1.5:
+                if new_distance > respawn_distance:
                     flight = self._create_random_flight(int(flight.flight_id[4:]))
                 else:
                     # Update flight with new position
@@ -212,10 +239,10 @@ class DemoDataGenerator:
                         destination=flight.destination,
                         latitude=new_lat,
                         longitude=new_lon,
-                        altitude=flight.altitude + random.randint(-100, 100),  # Slight altitude change
-                        ground_speed=flight.ground_speed + random.randint(-5, 5),
-                        heading=(flight.heading + random.randint(-2, 2)) % 360,
-                        distance_km=round(new_distance, 1),
+                        altitude=flight.altitude + randint(-100, 100),  # Slight altitude change
+                        ground_speed=flight.ground_speed + randint(-5, 5),
+                        heading=(flight.heading + randint(-2, 2)) % 360,
+                        distance_km=new_distance,
                         registration=flight.registration,
                     )
 
@@ -232,12 +259,7 @@ class DemoDataGenerator:
                 # Add a new flight
                 self._flights.append(self._create_random_flight(len(self._flights)))
 
-        return self._flights.copy()
-
-    def _calculate_distance(self, lat: float, lon: float) -> float:
-        """Calculate distance from center point."""
-        from .utils import haversine_distance
-        return haversine_distance(self.center_lat, self.center_lon, lat, lon)
+        return self._flights
 
 
 class DemoClient:
@@ -278,8 +300,12 @@ class DemoClient:
         Returns:
             List of demo Flight objects
         """
+        # get_flights() builds a new list each call, so it is handed over as
+        # is; only slice it when there are more flights than asked for
         flights = self.generator.get_flights()
-        return flights[:limit]
+        if len(flights) > limit:
+            flights = flights[:limit]
+        return flights
 
     def get_live_flights_light(
         self,
@@ -317,6 +343,21 @@ class DemoClient:
         """
         return []
 
+    def get_flight_details_bulk(
+        self,
+        callsigns: List[str],
+    ) -> List[Flight]:
+        """
+        Get demo flight details for any number of callsigns (no-op for demo mode).
+
+        Args:
+            callsigns: List of callsigns to fetch
+
+        Returns:
+            Empty list (details already in light response for demo)
+        """
+        return []
+
     def close(self):
         """No-op for demo client."""
         pass
@@ -1,15 +1,15 @@
 """Flight details cache for efficient API usage."""
 
 import logging
+import sys
 import time
-from dataclasses import dataclass
-from typing import Dict, Optional, Set
+from collections import deque
+from typing import Deque, Dict, Iterable, NamedTuple, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class CachedFlightDetails:
+class CachedFlightDetails(NamedTuple):
     """Cached details for a flight (data that doesn't change during flight)."""
 
     flight_id: str
@@ -18,11 +18,7 @@ class CachedFlightDetails:
     origin: str
     destination: str
     registration: str
-    cached_at: float  # timestamp
-
-    def is_expired(self, ttl_seconds: int = 3600) -> bool:
-        """Check if cache entry has expired."""
-        return (time.time() - self.cached_at) > ttl_seconds
+    cached_at: float  # time.monotonic() timestamp
 
 
 class FlightCache:
@@ -34,17 +30,28 @@ class FlightCache:
     - Full endpoint: Called only for NEW flights not in cache (expensive)
     - Cache stores: aircraft type, airline, origin, destination
     - Position data always comes from light endpoint (real-time)
+    - Size is bounded: the oldest entry is evicted on overflow
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, maxsize: int = 1024):
         """
         Initialize the flight cache.
 
         Args:
-            ttl_seconds: Time-to-live for cache entries (default 1 hour)
+            ttl_seconds: Time-to-live for cache entries (default 1 hour);
+                0 or less disables expiry, leaving removal to
+                cleanup_departed() and the size bound
+            maxsize: Maximum number of entries kept (default 1024)
         """
+        # Plain dict: insertion order is cache order, oldest first
         self._cache: Dict[str, CachedFlightDetails] = {}
+        # (cached_at, flight_id) in insertion order, so expiry can stop at
+        # the first entry that is still fresh
+        self._expiry_queue: Deque[Tuple[float, str]] = deque()
         self._ttl_seconds = ttl_seconds
+        # Decided once, so lookups skip the clock when nothing can expire
+        self._check_expiry = ttl_seconds > 0
+        self._maxsize = maxsize
         self._hits = 0
         self._misses = 0
 
@@ -63,7 +70,7 @@ class FlightCache:
             self._misses += 1
             return None
 
-        if entry.is_expired(self._ttl_seconds):
+        if self._check_expiry and time.monotonic() - entry.cached_at > self._ttl_seconds:
             del self._cache[flight_id]
             self._misses += 1
             return None
@@ -71,6 +78,40 @@ class FlightCache:
         self._hits += 1
         return entry
 
+    def get_many(self, flight_ids: Iterable[str]) -> Dict[str, CachedFlightDetails]:
+        """
+        Get cached details for several flights at once.
+
+        Equivalent to calling get() for each ID, but reads the clock once and
+        updates the hit/miss statistics once for the whole batch.
+
+        Args:
+            flight_ids: The flights' fr24_ids
+
+        Returns:
+            Dict of flight ID to CachedFlightDetails for IDs found and not expired
+        """
+        cache = self._cache
+        check_expiry = self._check_expiry
+        now = time.monotonic()
+        ttl = self._ttl_seconds
+        found = {}
+        misses = 0
+
+        for fid in flight_ids:
+            entry = cache.get(fid)
+            if entry is None:
+                misses += 1
+            elif check_expiry and now - entry.cached_at > ttl:
+                del cache[fid]
+                misses += 1
+            else:
+                found[fid] = entry
+
+        self._hits += len(found)
+        self._misses += misses
+        return found
+
     def put(
         self,
         flight_id: str,
@@ -91,31 +132,70 @@ class FlightCache:
             destination: Destination airport code
             registration: Aircraft registration
         """
-        self._cache[flight_id] = CachedFlightDetails(
-            flight_id=flight_id,
-            aircraft_type=aircraft_type,
-            airline=airline,
-            origin=origin,
-            destination=destination,
-            registration=registration,
-            cached_at=time.time(),
+        cache = self._cache
+        now = time.monotonic()
+        intern = sys.intern
+
+        # Re-insert so a refreshed entry moves to the newest position
+        cache.pop(flight_id, None)
+        cache[flight_id] = CachedFlightDetails(
+            flight_id,
+            intern(aircraft_type),
+            intern(airline),
+            intern(origin),
+            intern(destination),
+            registration,
+            now,
         )
-        logger.debug(f"Cached details for flight {flight_id}")
+        if self._check_expiry:
+            self._expiry_queue.append((now, flight_id))
+
+        # Evict oldest entries beyond the size bound
+        while len(cache) > self._maxsize:
+            del cache[next(iter(cache))]
+
+        # Evicted and re-cached entries leave stale items in the expiry
+        # queue; rebuild it from the cache (same order) so it stays bounded
+        # even if cleanup_expired() is not called
+        if len(self._expiry_queue) > 2 * self._maxsize:
+            self._expiry_queue = deque(
+                (entry.cached_at, fid) for fid, entry in cache.items()
+            )
+
+        logger.debug("Cached details for flight %s", flight_id)
 
     def get_missing_ids(self, flight_ids: Set[str]) -> Set[str]:
         """
         Get flight IDs that are not in cache (need full API lookup).
 
+        This is a bulk membership check: it does not count towards the
+        hit/miss statistics.
+
         Args:
             flight_ids: Set of flight IDs to check
 
         Returns:
             Set of flight IDs not in cache or expired
         """
-        missing = set()
-        for fid in flight_ids:
-            if self.get(fid) is None:
-                missing.add(fid)
+        if not flight_ids:
+            return set()
+
+        cache = self._cache
+
+        # Uncached IDs via a C-level set difference against the keys view
+        missing = flight_ids - cache.keys()
+
+        # Cached but expired entries also need a fresh lookup. The expiry queue
+        # is oldest first, so if its head is still fresh nothing has expired
+        queue = self._expiry_queue
+        if self._check_expiry and queue:
+            now = time.monotonic()
+            ttl = self._ttl_seconds
+            if now - queue[0][0] > ttl:
+                missing.update(
+                    fid for fid in flight_ids & cache.keys()
+                    if now - cache[fid].cached_at > ttl
+                )
         return missing
 
     def cleanup_expired(self) -> int:
@@ -125,17 +205,28 @@ class FlightCache:
         Returns:
             Number of entries removed
         """
-        expired = [
-            fid for fid, entry in self._cache.items()
-            if entry.is_expired(self._ttl_seconds)
-        ]
-        for fid in expired:
-            del self._cache[fid]
+        if not self._check_expiry:
+            return 0
+
+        cache = self._cache
+        queue = self._expiry_queue
+        now = time.monotonic()
+        ttl = self._ttl_seconds
+        removed = 0
+
+        # Entries are queued oldest first, so stop at the first fresh one
+        while queue and now - queue[0][0] > ttl:
+            cached_at, fid = queue.popleft()
+            entry = cache.get(fid)
+            # Skip entries already removed or re-cached since being queued
+            if entry is not None and entry.cached_at == cached_at:
+                del cache[fid]
+                removed += 1
 
-        if expired:
-            logger.debug(f"Cleaned up {len(expired)} expired cache entries")
+        if removed:
+            logger.debug("Cleaned up %d expired cache entries", removed)
 
-        return len(expired)
+        return removed
 
     def cleanup_departed(self, current_flight_ids: Set[str]) -> int:
         """
@@ -147,12 +238,12 @@ class FlightCache:
         Returns:
             Number of entries removed
         """
-        departed = set(self._cache.keys()) - current_flight_ids
+        departed = self._cache.keys() - current_flight_ids
         for fid in departed:
             del self._cache[fid]
 
         if departed:
-            logger.debug(f"Removed {len(departed)} departed flights from cache")
+            logger.debug("Removed %d departed flights from cache", len(departed))
 
         return len(departed)
 
@@ -176,5 +267,6 @@ class FlightCache:
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry_queue.clear()
         self._hits = 0
         self._misses = 0
@@ -6,8 +6,11 @@ Displays live flight data from FlightRadar24 on a Raspberry Pi touchscreen.
 """
 
 import argparse
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from .app import FlightDisplayApp
@@ -100,11 +103,17 @@ def setup_logging(verbose: bool):
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
 
+    # Write records from a background thread so logging calls on the UI and
+    # updater threads never block on console or SD card I/O
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Flush remaining records on exit
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     # Reduce noise from requests library
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -1,10 +1,22 @@
 """Data models for Flight Display."""
 
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Optional
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Values a Flight holds for details that are not known (see __post_init__)
+MISSING_VALUES = frozenset({"", None, "N/A", "---"})
+
+# Flight details that can be filled in from cached lookups
+DETAIL_FIELDS = ("aircraft_type", "airline", "origin", "destination", "registration")
+_get_details = attrgetter(*DETAIL_FIELDS)
+
+
+@dataclass(**SLOTS)
 class Flight:
     """Represents a single flight with position and route information."""
 
@@ -24,7 +36,7 @@ class Flight:
     vertical_speed: Optional[int] = None  # feet per minute
 
     def __post_init__(self):
-        """Ensure callsign has a default if empty."""
+        """Fill in defaults for empty fields and intern the short codes."""
         if not self.callsign:
             self.callsign = "N/A"
         if not self.airline:
@@ -35,3 +47,22 @@ class Flight:
             self.origin = "---"
         if not self.destination:
             self.destination = "---"
+
+        # Codes come from a small set, so share one string object per code
+        intern = sys.intern
+        self.airline = intern(self.airline)
+        self.aircraft_type = intern(self.aircraft_type)
+        self.origin = intern(self.origin)
+        self.destination = intern(self.destination)
+
+    def merge_cached(self, cached) -> None:
+        """
+        Fill in details the live data lacks from cached details.
+
+        Args:
+            cached: Cached details for this flight (anything with the
+                DETAIL_FIELDS attributes, e.g. CachedFlightDetails)
+        """
+        for name, value in zip(DETAIL_FIELDS, _get_details(cached)):
+            if value and getattr(self, name) in MISSING_VALUES:
+                setattr(self, name, value)
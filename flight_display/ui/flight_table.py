@@ -1,10 +1,14 @@
 """Scrollable flight table widget for Flight Display."""
 
 import tkinter as tk
-from typing import List
+from typing import List, Tuple
 
 from ..models import Flight
-from .theme import COLORS, FONTS, COLUMNS
+from ..utils import format_altitude, format_heading
+from .theme import COLORS, FONTS, COLUMNS, COLUMN_ANCHORS, COLUMN_WIDTHS
+
+# Pre-bound cell formatter for the refresh path
+_fmt_distance = "{:.1f}".format
 
 
 class FlightTable(tk.Frame):
@@ -19,7 +23,12 @@ class FlightTable(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_primary"])
         self._last_y = 0
+        # Pool of row widgets, reused across refreshes; only the first
+        # _visible_rows are packed
         self.flight_rows: List[tk.Frame] = []
+        self._row_labels: List[List[tk.Label]] = []
+        self._row_texts: List[Tuple[str, ...]] = []
+        self._visible_rows = 0
         self._create_widgets()
 
     def _create_widgets(self):
@@ -98,6 +107,11 @@ class FlightTable(tk.Frame):
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+    def _bind_scroll(self, widget: tk.Widget):
+        """Bind touch/drag scrolling to a widget inside the table."""
+        widget.bind("<Button-1>", self._start_scroll)
+        widget.bind("<B1-Motion>", self._do_scroll)
+
     def _start_scroll(self, event):
         """Record starting position for touch scroll."""
         self._last_y = event.y
@@ -124,53 +138,94 @@ class FlightTable(tk.Frame):
         Args:
             flights: List of Flight objects to display
         """
-        self.clear()
+        changed = False
 
         for idx, flight in enumerate(flights):
-            bg_color = COLORS["bg_secondary"] if idx % 2 == 0 else COLORS["row_alt"]
-            row = self._create_row(flight, bg_color)
-            row.pack(fill=tk.X, pady=1)
-            self.flight_rows.append(row)
-
-            # Bind scroll events to row and its children
-            row.bind("<Button-1>", self._start_scroll)
-            row.bind("<B1-Motion>", self._do_scroll)
-            for child in row.winfo_children():
-                child.bind("<Button-1>", self._start_scroll)
-                child.bind("<B1-Motion>", self._do_scroll)
-
-    def _create_row(self, flight: Flight, bg_color: str) -> tk.Frame:
+            values = self._format_values(flight)
+
+            if idx == len(self.flight_rows):
+                self._add_row(idx)
+
+            # Only touch labels whose text actually changed
+            for label, text, shown in zip(self._row_labels[idx], values, self._row_texts[idx]):
+                if text != shown:
+                    label.configure(text=text)
+                    changed = True
+            self._row_texts[idx] = values
+
+            row = self.flight_rows[idx]
+            if idx >= self._visible_rows:
+                row.pack(fill=tk.X, pady=1)
+                changed = True
+
+        # Hide (but keep) rows no longer needed
+        for row in self.flight_rows[len(flights):self._visible_rows]:
+            row.pack_forget()
+            changed = True
+        self._visible_rows = len(flights)
+
+        # Flush all pending geometry/redraw work once, after every change is queued
+        if changed:
+            self.update_idletasks()
+
+    def _format_values(self, flight: Flight) -> Tuple[str, ...]:
         """
-        Create a row frame for a flight.
+        Get the cell texts for a flight.
 
         Args:
             flight: Flight data
-            bg_color: Background color for the row
 
         Returns:
-            Frame containing the flight row
+            Cell texts matching column order
         """
-        row = tk.Frame(self.scrollable_frame, bg=bg_color, height=26)
-        row.pack_propagate(False)
-
         # Format route as "ORG -> DST"
         route = f"{flight.origin} -> {flight.destination}"
         if flight.origin == "---" and flight.destination == "---":
             route = "---"
 
         # Create cell values matching column order
-        values = [
+        values = (
             flight.callsign,
             flight.airline,
             flight.aircraft_type,
             route,
-            f"{flight.altitude:,}" if flight.altitude else "---",
+            format_altitude(flight.altitude) if flight.altitude else "---",
             str(flight.ground_speed) if flight.ground_speed else "---",
-            f"{flight.heading:03d}" if flight.heading else "---",
-            f"{flight.distance_km:.1f}",
-        ]
+            format_heading(flight.heading) if flight.heading else "---",
+            _fmt_distance(flight.distance_km),
+        )
+
+        return values
+
+    def _add_row(self, idx: int):
+        """
+        Add a new (empty, unpacked) row to the widget pool.
+
+        Args:
+            idx: Position of the row in the table
+        """
+        bg_color = COLORS["bg_secondary"] if idx % 2 == 0 else COLORS["row_alt"]
+        row, labels = self._create_row(bg_color)
+        self.flight_rows.append(row)
+        self._row_labels.append(labels)
+        self._row_texts.append(("",) * len(labels))
+
+    def _create_row(self, bg_color: str) -> Tuple[tk.Frame, List[tk.Label]]:
+        """
+        Create an empty row frame for a flight.
+
+        Args:
+            bg_color: Background color for the row
 
-        for (col_id, _, width_px, anchor), value in zip(COLUMNS, values):
+        Returns:
+            Frame containing the row, and its cell labels in column order
+        """
+        row = tk.Frame(self.scrollable_frame, bg=bg_color, height=26)
+        row.pack_propagate(False)
+        self._bind_scroll(row)
+        labels = []
+
+        for width_px, anchor in zip(COLUMN_WIDTHS, COLUMN_ANCHORS):
             # Use a frame with fixed width to match header
             cell_frame = tk.Frame(row, bg=bg_color, width=width_px, height=26)
             cell_frame.pack(side=tk.LEFT, padx=1)
@@ -178,18 +233,26 @@ class FlightTable(tk.Frame):
 
             label = tk.Label(
                 cell_frame,
-                text=value,
+                text="",
                 font=FONTS["data"],
                 fg=COLORS["text_primary"],
                 bg=bg_color,
                 anchor=anchor,
             )
             label.pack(fill=tk.BOTH, expand=True)
+            labels.append(label)
+
+            # Rows are reused, so scroll events only need binding once
+            self._bind_scroll(cell_frame)
+            self._bind_scroll(label)
 
-        return row
+        return row, labels
 
     def clear(self):
         """Remove all flight rows."""
         for row in self.flight_rows:
             row.destroy()
         self.flight_rows.clear()
+        self._row_labels.clear()
+        self._row_texts.clear()
+        self._visible_rows = 0
@@ -41,8 +41,10 @@ class MainWindow(tk.Tk):
         # Bind escape key to exit (useful for testing)
         self.bind("<Escape>", lambda e: self.destroy())
 
-        # Prevent screen from blanking (runs periodically)
-        self.after(60000, self._prevent_screen_blank)
+        # Prevent screen from blanking, kiosk (fullscreen) mode only: this
+        # changes settings for the whole X session and they are not restored
+        if fullscreen:
+            self._disable_screen_blank()
 
         # Create layout
         self._create_widgets()
@@ -131,17 +133,14 @@ class MainWindow(tk.Tk):
             fg=COLORS["success"] if connected else COLORS["error"]
         )
 
-    def _prevent_screen_blank(self):
-        """Periodically reset screen saver/blanking timer."""
+    def _disable_screen_blank(self):
+        """Turn off the screen saver, blanking and DPMS power saving."""
         try:
             # Try xset (works on X11)
             subprocess.run(
-                ["xset", "s", "reset"],
+                ["xset", "s", "off", "s", "noblank", "-dpms"],
                 capture_output=True,
                 timeout=1,
             )
         except (FileNotFoundError, subprocess.TimeoutExpired):
             pass  # xset not available or timed out
-
-        # Schedule next reset
-        self.after(60000, self._prevent_screen_blank)
@@ -17,6 +17,10 @@ class StatusBar(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg_status"], height=25)
         self.pack_propagate(False)
+        # Last values shown, so unchanged labels are not reconfigured
+        self._last_update = None
+        self._last_count = None
+        self._last_status = None
         self._create_widgets()
 
     def _create_widgets(self):
@@ -67,9 +71,17 @@ class StatusBar(tk.Frame):
             status: Status message to display
             connected: Whether connection is active
         """
-        self.last_update_label.configure(text=f"Updated: {last_update}")
-        self.flight_count_label.configure(text=f"Flights: {flight_count}")
-        self.status_label.configure(
-            text=status,
-            fg=COLORS["success"] if connected else COLORS["error"],
-        )
+        if last_update != self._last_update:
+            self.last_update_label.configure(text=f"Updated: {last_update}")
+            self._last_update = last_update
+
+        if flight_count != self._last_count:
+            self.flight_count_label.configure(text=f"Flights: {flight_count}")
+            self._last_count = flight_count
+
+        if (status, connected) != self._last_status:
+            self.status_label.configure(
+                text=status,
+                fg=COLORS["success"] if connected else COLORS["error"],
+            )
+            self._last_status = (status, connected)
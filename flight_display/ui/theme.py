@@ -40,3 +40,7 @@ COLUMNS = [
     ("heading", "HDG", 50, "e"),
     ("distance", "DIST km", 80, "e"),
 ]
+
+# Per-column widths and anchors, split out once for building table rows
+COLUMN_WIDTHS = tuple(col[2] for col in COLUMNS)
+COLUMN_ANCHORS = tuple(col[3] for col in COLUMNS)
@@ -1,18 +1,24 @@
 """Background data updater for Flight Display."""
 
 import logging
-import queue
 import threading
-from typing import Callable, List, Optional, Set
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, FrozenSet, List, Optional, Set, Union
 
 from .api_client import FR24Client, FR24APIError
 from .config import Config
 from .flight_cache import FlightCache
 from .models import Flight
-from .utils import haversine_distance
+from .utils import haversine_from_center
 
 logger = logging.getLogger(__name__)
 
+# Bounds for how often the main thread checks for new data (milliseconds)
+MIN_POLL_INTERVAL_MS = 100
+MAX_POLL_INTERVAL_MS = 500
+
 
 class DataUpdater:
     """Background thread that polls the FR24 API and pushes updates to a queue."""
@@ -38,17 +44,37 @@ class DataUpdater:
         self.on_update = on_update
         self.on_error = on_error
 
-        self.data_queue: queue.Queue = queue.Queue()
+        # Single producer (worker thread), single consumer (Tk main thread):
+        # deque.append/popleft are atomic, so no lock is needed. Items are
+        # either a flight list (update) or an error message string
+        self.data_queue: Deque[Union[List[Flight], str]] = deque()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
 
+        # The worker produces at most one payload per refresh interval, so
+        # poll at a small fraction of it rather than at a fixed fast rate
+        self._poll_interval_ms = min(
+            MAX_POLL_INTERVAL_MS,
+            max(MIN_POLL_INTERVAL_MS, int(config.display.refresh_interval * 1000 / 20)),
+        )
+
         # Cache for flight details (aircraft type, airline, route)
         self._flight_cache = FlightCache(ttl_seconds=3600)
         self._details_fetch_interval = 5  # Fetch details every N updates
         self._update_count = 0
 
+        # Flight IDs seen on the previous tick, and those still lacking cached
+        # details, so each tick only checks the cache for IDs that may be missing
+        self._prev_flight_ids: FrozenSet[str] = frozenset()
+        self._unresolved_ids: Set[str] = set()
+
+        # Full-detail lookups run in the background so they never delay a
+        # position update; results are cached on a later tick
+        self._details_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_details: Optional[Future] = None
+
     def start(self):
         """Start the background update thread."""
         if self._thread is not None and self._thread.is_alive():
@@ -66,12 +92,34 @@ class DataUpdater:
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=5)
+            if self._thread.is_alive():
+                # Still mid-request or backing off; it exits (and releases
+                # its details pool) at its next stop check
+                logger.warning("Updater thread still finishing, not waiting for it")
+                return
             self._thread = None
         logger.info("Background updater stopped")
 
     def _worker(self):
-        """Worker thread that polls the API using hybrid light+full strategy."""
+        """Worker thread: run the poll loop, then release the details pool."""
+        # The pool lives exactly as long as this thread, so it is never used
+        # after shutdown even if stop() stops waiting for the thread
+        self._details_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="details-fetch"
+        )
+        try:
+            self._poll_loop()
+        finally:
+            self._details_pool.shutdown(wait=False, cancel_futures=True)
+            self._details_pool = None
+            self._pending_details = None
+
+    def _poll_loop(self):
+        """Poll the API using hybrid light+full strategy until stopped."""
         while not self._stop_event.is_set():
+            # Ticks are scheduled from their start, so time spent fetching
+            # does not stretch the refresh period
+            deadline = time.monotonic() + self.config.display.refresh_interval
             try:
                 self._update_count += 1
 
@@ -84,77 +132,85 @@ class DataUpdater:
                 # Get current flight IDs
                 current_flight_ids = {f.flight_id for f in flights if f.flight_id}
 
-                # Step 2: Check for new flights not in cache
-                missing_ids = self._flight_cache.get_missing_ids(current_flight_ids)
+                # Step 2: Cache details fetched in the background since the last tick
+                self._collect_details()
 
-                # Step 3: Fetch full details for new flights (if any and using full endpoint)
-                if missing_ids and self.config.api.endpoint_type == "full":
-                    # Get callsigns for missing flights
-                    missing_callsigns = [
+                # Step 3: Check for new flights not in cache. Only flights that
+                # arrived since the last tick, or were still unresolved then, can
+                # be missing; every 10th tick checks all of them so expired
+                # entries are caught too
+                if self._update_count % 10 == 0:
+                    candidate_ids = current_flight_ids
+                else:
+                    candidate_ids = (current_flight_ids - self._prev_flight_ids) | (
+                        self._unresolved_ids & current_flight_ids
+                    )
+                missing_ids = self._flight_cache.get_missing_ids(candidate_ids)
+                self._unresolved_ids = missing_ids
+                self._prev_flight_ids = frozenset(current_flight_ids)
+
+                # Step 4: Start fetching full details for new flights in the background
+                # (if any, using full endpoint, and no fetch is already in progress)
+                if (
+                    missing_ids
+                    and self.config.api.endpoint_type == "full"
+                    and self._pending_details is None
+                ):
+                    # Get callsigns for missing flights, without repeats so no
+                    # API request slot is spent on the same callsign twice
+                    missing_callsigns = list(dict.fromkeys(
                         f.callsign for f in flights
                         if f.flight_id in missing_ids and f.callsign
-                    ]
+                    ))
 
                     if missing_callsigns:
                         logger.debug(
-                            f"Fetching details for {len(missing_callsigns)} new flights"
+                            "Fetching details for %d new flights", len(missing_callsigns)
+                        )
+                        self._pending_details = self._details_pool.submit(
+                            self.api_client.get_flight_details_bulk,
+                            callsigns=missing_callsigns,
                         )
-                        try:
-                            detailed_flights = self.api_client.get_flight_details(
-                                callsigns=missing_callsigns[:15]  # API limit
-                            )
-
-                            # Cache the details
-                            for df in detailed_flights:
-                                self._flight_cache.put(
-                                    flight_id=df.flight_id,
-                                    aircraft_type=df.aircraft_type,
-                                    airline=df.airline,
-                                    origin=df.origin,
-                                    destination=df.destination,
-                                    registration=df.registration,
-                                )
-                        except FR24APIError as e:
-                            logger.warning(f"Failed to fetch flight details: {e}")
-
-                # Step 4: Enrich flights with cached details
+
+                # Step 5: Enrich flights with cached details
+                cached_details = self._flight_cache.get_many(current_flight_ids)
+                if cached_details:
+                    for flight in flights:
+                        cached = cached_details.get(flight.flight_id)
+                        if cached is not None:
+                            # Merge cached details with live position data
+                            flight.merge_cached(cached)
+
+                # Calculate distances from center for all flights in one pass,
+                # using the center terms precomputed on the location
+                location = self.config.location
+                center_lat_rad = location.center_lat_rad
+                center_lon_rad = location.center_lon_rad
+                center_cos_lat = location.center_cos_lat
                 for flight in flights:
-                    cached = self._flight_cache.get(flight.flight_id)
-                    if cached:
-                        # Merge cached details with live position data
-                        if not flight.aircraft_type and cached.aircraft_type:
-                            flight.aircraft_type = cached.aircraft_type
-                        if not flight.airline and cached.airline:
-                            flight.airline = cached.airline
-                        if not flight.origin and cached.origin:
-                            flight.origin = cached.origin
-                        if not flight.destination and cached.destination:
-                            flight.destination = cached.destination
-                        if not flight.registration and cached.registration:
-                            flight.registration = cached.registration
-
-                    # Calculate distance from center
-                    flight.distance_km = haversine_distance(
-                        self.config.location.center_lat,
-                        self.config.location.center_lon,
+                    flight.distance_km = haversine_from_center(
+                        center_lat_rad,
+                        center_lon_rad,
+                        center_cos_lat,
                         flight.latitude,
                         flight.longitude,
                     )
 
-                # Step 5: Periodic cache cleanup
+                # Step 6: Periodic cache cleanup
                 if self._update_count % 10 == 0:
                     self._flight_cache.cleanup_departed(current_flight_ids)
                     self._flight_cache.cleanup_expired()
-                    logger.debug(f"Cache stats: {self._flight_cache.stats}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Cache stats: %s", self._flight_cache.stats)
 
-                self.data_queue.put(("success", flights))
+                self.data_queue.append(flights)
                 self._consecutive_errors = 0
-                logger.debug(f"Fetched {len(flights)} flights ({len(missing_ids)} new)")
+                logger.debug("Fetched %d flights (%d new)", len(flights), len(missing_ids))
 
             except FR24APIError as e:
                 self._consecutive_errors += 1
                 error_msg = str(e)
-                self.data_queue.put(("error", error_msg))
+                self.data_queue.append(error_msg)
                 logger.warning(f"API error ({self._consecutive_errors}): {error_msg}")
 
                 # Back off if too many consecutive errors
@@ -166,11 +222,38 @@ class DataUpdater:
             except Exception as e:
                 self._consecutive_errors += 1
                 error_msg = f"Unexpected error: {e}"
-                self.data_queue.put(("error", error_msg))
+                self.data_queue.append(error_msg)
                 logger.exception(error_msg)
 
             # Wait for next update interval or stop signal
-            self._stop_event.wait(self.config.display.refresh_interval)
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+            else:
+                logger.debug("Update overran the refresh interval, starting next one now")
+
+    def _collect_details(self) -> None:
+        """Cache the results of a finished background details fetch, if any."""
+        future = self._pending_details
+        if future is None or not future.done():
+            return
+
+        self._pending_details = None
+        try:
+            detailed_flights = future.result()
+        except FR24APIError as e:
+            logger.warning(f"Failed to fetch flight details: {e}")
+            return
+
+        for df in detailed_flights:
+            self._flight_cache.put(
+                flight_id=df.flight_id,
+                aircraft_type=df.aircraft_type,
+                airline=df.airline,
+                origin=df.origin,
+                destination=df.destination,
+                registration=df.registration,
+            )
 
     def process_queue(self, root) -> None:
         """
@@ -181,18 +264,17 @@ class DataUpdater:
         Args:
             root: Tkinter root window for scheduling next check
         """
-        try:
-            while True:
-                status, data = self.data_queue.get_nowait()
-                if status == "success":
-                    self.on_update(data)
-                else:
-                    self.on_error(data)
-        except queue.Empty:
-            pass
-
-        # Schedule next queue check
-        root.after(100, lambda: self.process_queue(root))
+        data_queue = self.data_queue
+        while data_queue:
+            data = data_queue.popleft()
+            if isinstance(data, str):
+                self.on_error(data)
+            else:
+                self.on_update(data)
+
+        # Schedule next queue check (stops once the updater is stopped)
+        if self.is_running:
+            root.after(self._poll_interval_ms, lambda: self.process_queue(root))
 
     @property
     def is_running(self) -> bool:
@@ -1,12 +1,19 @@
 """Utility functions for Flight Display."""
 
-from math import radians, sin, cos, sqrt, atan2
+from functools import lru_cache
+from math import radians, sin, cos, sqrt, asin
+
+EARTH_RADIUS_KM = 6371.0
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great-circle distance between two points on Earth.
 
+    General two-point form, kept as the package's public distance helper.
+    Repeated distances from one fixed center should use haversine_from_center()
+    with the center's terms precomputed instead.
+
     Args:
         lat1: Latitude of first point in degrees
         lon1: Longitude of first point in degrees
@@ -16,7 +23,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in kilometers
     """
-    R = 6371.0  # Earth's radius in kilometers
+    R = EARTH_RADIUS_KM
 
     lat1_rad = radians(lat1)
     lon1_rad = radians(lon1)
@@ -26,24 +33,67 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     dlat = lat2_rad - lat1_rad
     dlon = lon2_rad - lon1_rad
 
-    a = sin(dlat / 2) ** 2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    # Square by multiplying: cheaper than float ** 2 in the interpreter
+    sin_half_dlat = sin(dlat / 2)
+    sin_half_dlon = sin(dlon / 2)
+    a = sin_half_dlat * sin_half_dlat + cos(lat1_rad) * cos(lat2_rad) * sin_half_dlon * sin_half_dlon
+    # min() guards against a creeping past 1 through rounding
+    c = 2 * asin(sqrt(min(1.0, a)))
 
     return round(R * c, 1)
 
 
+def haversine_from_center(
+    center_lat_rad: float,
+    center_lon_rad: float,
+    center_cos_lat: float,
+    lat2: float,
+    lon2: float,
+) -> float:
+    """
+    Calculate the distance from a precomputed center point to a point.
+
+    Same result as haversine_distance(), but the center's radians and cosine
+    are passed in rather than recomputed on every call.
+
+    Args:
+        center_lat_rad: Latitude of the center point in radians
+        center_lon_rad: Longitude of the center point in radians
+        center_cos_lat: Cosine of the center latitude
+        lat2: Latitude of the point in degrees
+        lon2: Longitude of the point in degrees
+
+    Returns:
+        Distance in kilometers
+    """
+    lat2_rad = radians(lat2)
+    sin_half_dlat = sin((lat2_rad - center_lat_rad) / 2)
+    sin_half_dlon = sin((radians(lon2) - center_lon_rad) / 2)
+    a = sin_half_dlat * sin_half_dlat + center_cos_lat * cos(lat2_rad) * sin_half_dlon * sin_half_dlon
+    return round(2 * EARTH_RADIUS_KM * asin(sqrt(min(1.0, a))), 1)
+
+
+@lru_cache(maxsize=4096)
 def format_altitude(altitude: int) -> str:
     """Format altitude with thousands separator."""
     return f"{altitude:,}"
 
 
+# Every whole-degree heading, formatted once at import
+_HEADINGS = tuple(f"{h:03d}" for h in range(360))
+
+
 def format_heading(heading: int) -> str:
     """Format heading as 3-digit number with leading zeros."""
+    if 0 <= heading < 360:
+        return _HEADINGS[heading]
     return f"{heading:03d}"
 
 
+_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+
 def compass_direction(heading: int) -> str:
     """Convert heading to compass direction."""
-    directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-    index = round(heading / 45) % 8
-    return directions[index]
+    # Integer form of round(heading / 45) % 8 (no ties occur for int headings)
+    return _DIRECTIONS[((heading * 8 + 180) // 360) & 7]